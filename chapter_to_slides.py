@@ -7,10 +7,14 @@ Uses tex2img for LaTeX equation rendering and python-pptx for slide generation.
 import re
 import os
 import sys
+import shutil
+import hashlib
 import argparse
 from pathlib import Path
 import json
-from typing import List, Dict, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, partial
+from typing import Iterator, List, Dict, Tuple, Optional
 
 # Check for required packages
 try:
@@ -18,18 +22,76 @@ try:
     from pptx.util import Inches, Pt
     from pptx.enum.text import PP_ALIGN
     from pptx.dml.color import RGBColor
+    from pptx.oxml.ns import qn
+    from lxml import etree
 except ImportError:
     print("Error: python-pptx not installed. Run: pip install python-pptx")
     sys.exit(1)
 
-try:
-    import matplotlib
-    matplotlib.use('Agg')  # Non-interactive backend
-    import matplotlib.pyplot as plt
-    from matplotlib import mathtext
-except ImportError:
-    print("Error: matplotlib not installed. Run: pip install matplotlib")
-    sys.exit(1)
+# Compiled once at import; the parser reuses them for every chapter.
+# Chapter-level patterns are bytes: the parser scans the raw UTF-8 file and
+# decodes only what it extracts. Every delimiter is ASCII, so match
+# boundaries always fall on character boundaries.
+_RE_MACRO = re.compile(r'\\newcommand\{[^}]+\}\{[^}]+\}')
+_RE_TITLE = re.compile(rb'^# (.+?)(?:\{|$)', re.MULTILINE)
+_RE_FIGURE = re.compile(rb'```\{python\}[^`]*?#\| label: (fig-[^\n]+)[^`]*?```', re.DOTALL)
+_RE_FIGCAP = re.compile(r'#\| fig-cap: (.+?)$', re.MULTILINE)
+_RE_IFRAME = re.compile(rb'<iframe[^>]*src="([^"]+)"[^>]*>.*?</iframe>', re.DOTALL)
+_RE_IFRAME_LABEL = re.compile(rb'\{#(fig-[^\}]+)\}')
+_RE_CALLOUT = re.compile(rb':::\ (\w+)\s*$(.+?)^:::', re.MULTILINE | re.DOTALL)
+_RE_BULLET = re.compile(r'^\s*(?:[-*]|\d+\.)\s+(.*)$')
+
+_RE_HEADING = re.compile(rb'^(#{2,4}) (?=.)', re.MULTILINE)
+
+# One pass over the chapter finds where each figure block / iframe starts.
+# Headers are streamed by _RE_HEADING and equations by _scan_equations.
+_RE_EMBED = re.compile(
+    rb'(?P<fig>(?=```\{python\}))'
+    rb'|(?P<if>(?=<iframe))')
+
+
+def _scan_equations(data: bytes) -> List[Tuple[str, int, int]]:
+    """Find $$...$$ and $...$ spans in one left-to-right pass over the chapter.
+
+    Returns (type, start, end) triples in document order. Display math runs to
+    the next $$; inline math must close on the same line with a single $. A $
+    after an odd number of backslashes is a literal dollar, not a delimiter.
+    """
+    spans = []
+    n = len(data)
+
+    def is_delim(k):
+        if k < 0 or k >= n or data[k] != 0x24:  # '$'
+            return False
+        b = k
+        while b > 0 and data[b - 1] == 0x5C:  # backslash
+            b -= 1
+        return (k - b) % 2 == 0
+
+    def next_delim(k):
+        while True:
+            k = data.find(b'$', k)
+            if k == -1 or is_delim(k):
+                return k
+            k += 1
+
+    i = next_delim(0)
+    while i != -1:
+        if is_delim(i + 1):
+            j = next_delim(i + 2)
+            if j > i + 2 and is_delim(j + 1):
+                spans.append(('display', i, j + 2))
+                i = next_delim(j + 2)
+                continue
+        elif not is_delim(i - 1):
+            j = next_delim(i + 1)
+            if j > i + 1 and data.find(b'\n', i + 1, j) == -1 and not is_delim(j + 1):
+                spans.append(('inline', i, j + 1))
+                i = next_delim(j + 1)
+                continue
+        i = next_delim(i + 1)
+
+    return spans
 
 
 class ChapterParser:
@@ -37,122 +99,149 @@ class ChapterParser:
 
     def __init__(self, qmd_file: str):
         self.qmd_file = Path(qmd_file)
-        self.content = self.qmd_file.read_text(encoding='utf-8')
+        content_bytes = self.qmd_file.read_bytes()
+        if b'\r' in content_bytes:
+            # Same newline translation read_text would have done
+            content_bytes = content_bytes.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        self.content_bytes = content_bytes
         self.macros = self._load_macros()
 
+    @cached_property
+    def content(self) -> str:
+        """The whole chapter as text, decoded on first access."""
+        return self.content_bytes.decode('utf-8')
+
+    def _text(self, start: int, end: int) -> str:
+        """Decode one slice of the chapter."""
+        return self.content_bytes[start:end].decode('utf-8')
+
+    @cached_property
+    def _embeds(self) -> Dict[str, list]:
+        """Start markers of figure blocks and iframes, found in one pass on first use."""
+        embeds = {'fig': [], 'if': []}
+        for match in _RE_EMBED.finditer(self.content_bytes):
+            embeds[match.lastgroup].append(match)
+        return embeds
+
+    def _iter_headings(self) -> Iterator[Tuple[int, str, int, int]]:
+        """Yield (level, title, start, body_start) for each ##, ### and #### header."""
+        for match in _RE_HEADING.finditer(self.content_bytes):
+            line_end = self.content_bytes.find(b'\n', match.end())
+            if line_end == -1:
+                line_end = len(self.content_bytes)
+            title = self._text(match.end(), line_end).strip()
+            yield len(match.group(1)), title, match.start(), line_end
+
     def _load_macros(self) -> str:
         """Load LaTeX macros from macros.qmd if it exists."""
         macros_file = self.qmd_file.parent / 'macros.qmd'
         if macros_file.exists():
             content = macros_file.read_text(encoding='utf-8')
             # Extract newcommand definitions
-            macro_pattern = r'\\newcommand\{[^}]+\}\{[^}]+\}'
-            macros = re.findall(macro_pattern, content)
+            macros = _RE_MACRO.findall(content)
             return '\n'.join(macros)
         return ''
 
     def extract_title(self) -> str:
         """Extract chapter title from markdown."""
-        match = re.search(r'^# (.+?)(?:\{|$)', self.content, re.MULTILINE)
-        return match.group(1).strip() if match else "Untitled"
+        match = _RE_TITLE.search(self.content_bytes)
+        return match.group(1).decode('utf-8').strip() if match else "Untitled"
 
     def extract_sections(self) -> List[Dict]:
         """Extract major sections (## headers) with content."""
         sections = []
 
-        # Find all ## sections
-        pattern = r'^## (.+?)$'
-        matches = list(re.finditer(pattern, self.content, re.MULTILINE))
-
-        for i, match in enumerate(matches):
-            title = match.group(1).strip()
-            start = match.end()
-
-            # Find content until next ## or end of file
-            if i < len(matches) - 1:
-                end = matches[i + 1].start()
-            else:
-                end = len(self.content)
-
-            content = self.content[start:end].strip()
-
-            sections.append({
-                'title': title,
-                'content': content,
-                'subsections': self._extract_subsections(content)
-            })
+        # Stream the headers, closing the open section / subsection when the
+        # next header arrives. A subsection runs to the next header of any
+        # level, since the one after the last subsection is the next ##.
+        section = None  # (title, offset, body_start, subsections)
+        sub = None      # (level, title, body_start)
+
+        for level, title, offset, start in self._iter_headings():
+            if sub:
+                section[3].append(self._subsection(*sub, offset))
+                sub = None
+            if level == 2:
+                if section:
+                    sections.append(self._section(*section, offset))
+                section = (title, offset, start, [])
+            elif section:
+                sub = (level, title, start)
+
+        end = len(self.content_bytes)
+        if sub:
+            section[3].append(self._subsection(*sub, end))
+        if section:
+            sections.append(self._section(*section, end))
 
         return sections
 
-    def _extract_subsections(self, content: str) -> List[Dict]:
-        """Extract ### and #### subsections from content."""
-        subsections = []
-
-        # Match both ### and ####
-        pattern = r'^(###|####) (.+?)$'
-        matches = list(re.finditer(pattern, content, re.MULTILINE))
-
-        for i, match in enumerate(matches):
-            level = len(match.group(1))
-            title = match.group(2).strip()
-            start = match.end()
-
-            if i < len(matches) - 1:
-                end = matches[i + 1].start()
-            else:
-                end = len(content)
-
-            sub_content = content[start:end].strip()
-
-            subsections.append({
-                'level': level,
-                'title': title,
-                'content': sub_content
-            })
-
-        return subsections
+    def _section(self, title: str, offset: int, start: int,
+                 subsections: List[Dict], end: int) -> Dict:
+        """Build a section whose body runs from start to the next ## (end)."""
+        return {
+            'title': title,
+            'content': self._text(start, end).strip(),
+            'subsections': subsections,
+            'start_offset': offset,
+            'end_offset': end
+        }
+
+    def _subsection(self, level: int, title: str, start: int, end: int) -> Dict:
+        """Build a ### or #### subsection whose body runs from start to end."""
+        return {
+            'level': level,
+            'title': title,
+            'content': self._text(start, end).strip()
+        }
 
     def extract_equations(self) -> List[Dict]:
         """Extract all LaTeX equations (display and inline)."""
         equations = []
 
-        # Display equations: $$...$$
-        display_pattern = r'\$\$([^$]+?)\$\$'
-        for match in re.finditer(display_pattern, self.content, re.DOTALL):
-            equations.append({
-                'type': 'display',
-                'latex': match.group(1).strip(),
-                'position': match.start()
-            })
-
-        # Inline equations: $...$
-        # Be careful not to match $$ which we already got
-        inline_pattern = r'(?<!\$)\$(?!\$)([^$\n]+?)\$(?!\$)'
-        for match in re.finditer(inline_pattern, self.content):
+        # Display equations: $$...$$, inline equations: $...$
+        for eq_type, start, end in _scan_equations(self.content_bytes):
+            delim = 2 if eq_type == 'display' else 1
             equations.append({
-                'type': 'inline',
-                'latex': match.group(1).strip(),
-                'position': match.start()
+                'type': eq_type,
+                'latex': self._text(start + delim, end - delim).strip(),
+                'position': start
             })
 
-        # Sort by position
-        equations.sort(key=lambda x: x['position'])
-
         return equations
 
     def extract_figures(self) -> List[Dict]:
         """Extract Python figure code blocks."""
+        return self.figures
+
+    def extract_iframes(self) -> List[Dict]:
+        """Extract iframe embeds."""
+        return self.iframes
+
+    def extract_callouts(self, content: str) -> List[Dict]:
+        """Extract callout boxes (Principle, Rule, etc.)."""
+        return self._find_callouts(content.encode('utf-8'))
+
+    @cached_property
+    def figures(self) -> List[Dict]:
+        """Python figure code blocks, extracted on first access."""
         figures = []
 
-        # Pattern for figure blocks with labels
-        pattern = r'```\{python\}[^`]*?#\| label: (fig-[^\n]+)[^`]*?```'
+        # Figure blocks with labels, matched from each block start the scan found
+        end = 0
+        for marker in self._embeds['fig']:
+            if marker.start() < end:
+                continue
+            match = _RE_FIGURE.match(self.content_bytes, marker.start())
+            if not match:
+                continue
+            end = match.end()
 
-        for match in re.finditer(pattern, self.content, re.DOTALL):
-            code = match.group(0)
-            label = match.group(1).strip()
+            code = match.group(0).decode('utf-8')
+            label = match.group(1).decode('utf-8').strip()
 
             # Extract caption if present
-            caption_match = re.search(r'#\| fig-cap: (.+?)$', code, re.MULTILINE)
+            caption_match = _RE_FIGCAP.search(code)
             caption = caption_match.group(1).strip() if caption_match else ''
 
             figures.append({
@@ -163,23 +252,30 @@ class ChapterParser:
 
         return figures
 
-    def extract_iframes(self) -> List[Dict]:
-        """Extract iframe embeds."""
+    @cached_property
+    def iframes(self) -> List[Dict]:
+        """Iframe embeds, extracted on first access."""
         iframes = []
 
-        pattern = r'<iframe[^>]*src="([^"]+)"[^>]*>.*?</iframe>'
+        end = 0
+        for marker in self._embeds['if']:
+            if marker.start() < end:
+                continue
+            match = _RE_IFRAME.match(self.content_bytes, marker.start())
+            if not match:
+                continue
+            end = match.end()
 
-        for match in re.finditer(pattern, self.content, re.DOTALL):
-            url = match.group(1)
+            url = match.group(1).decode('utf-8')
 
             # Try to find associated caption
             # Look for text after iframe or figure label
             context_start = max(0, match.start() - 200)
-            context_end = min(len(self.content), match.end() + 200)
-            context = self.content[context_start:context_end]
+            context_end = min(len(self.content_bytes), match.end() + 200)
+            context = self.content_bytes[context_start:context_end]
 
-            label_match = re.search(r'\{#(fig-[^\}]+)\}', context)
-            label = label_match.group(1) if label_match else ''
+            label_match = _RE_IFRAME_LABEL.search(context)
+            label = label_match.group(1).decode('utf-8') if label_match else ''
 
             iframes.append({
                 'url': url,
@@ -188,15 +284,18 @@ class ChapterParser:
 
         return iframes
 
-    def extract_callouts(self, content: str) -> List[Dict]:
-        """Extract callout boxes (Principle, Rule, etc.)."""
-        callouts = []
+    @cached_property
+    def callouts(self) -> List[Dict]:
+        """Callout boxes (Principle, Rule, etc.), extracted on first access."""
+        return self._find_callouts(self.content_bytes)
 
-        pattern = r':::\ (\w+)\s*$(.+?)^:::'
+    @staticmethod
+    def _find_callouts(data: bytes) -> List[Dict]:
+        callouts = []
 
-        for match in re.finditer(pattern, content, re.MULTILINE | re.DOTALL):
-            callout_type = match.group(1)
-            callout_content = match.group(2).strip()
+        for match in _RE_CALLOUT.finditer(data):
+            callout_type = match.group(1).decode('utf-8')
+            callout_content = match.group(2).decode('utf-8').strip()
 
             callouts.append({
                 'type': callout_type,
@@ -206,64 +305,172 @@ class ChapterParser:
         return callouts
 
 
+# Part of every equation cache key; bump it whenever render_equation's output
+# changes (padding, font sizes, colors) so stale PNGs are not reused
+_RENDER_VERSION = 2
+
+# Below this many uncached equations, rendering in-process beats starting a pool
+_MIN_POOL_TASKS = 8
+
+# Filled by _import_matplotlib on first EquationRenderer
+mathtext = mpl_image = FontProperties = np = None
+
+
+def _import_matplotlib():
+    """Import matplotlib and numpy into module globals, once per process.
+
+    Deferred until an EquationRenderer is built so --help and argument
+    errors don't pay matplotlib's startup cost.
+    """
+    global mathtext, mpl_image, FontProperties, np
+    if mathtext is not None:
+        return
+    try:
+        import matplotlib
+        matplotlib.use('Agg')  # Non-interactive backend
+        from matplotlib import mathtext
+        from matplotlib import image as mpl_image
+        from matplotlib.font_manager import FontProperties
+        import numpy as np
+    except ImportError:
+        print("Error: matplotlib not installed. Run: pip install matplotlib")
+        sys.exit(1)
+
+
 class EquationRenderer:
-    """Render LaTeX equations to PNG images using matplotlib."""
+    """Render LaTeX equations to PNG images using matplotlib mathtext."""
 
     def __init__(self, output_dir: Path, preamble: str = ''):
         self.output_dir = output_dir
         self.output_dir.mkdir(exist_ok=True)
         self.preamble = preamble
+        # Rendered PNGs keyed by LaTeX hash, reused across runs. Entries are
+        # never pruned; delete the directory to reclaim space
+        self.cache_dir = self.output_dir / '.cache'
+        self.cache_dir.mkdir(exist_ok=True)
+
+        _import_matplotlib()
+        # One parser for the whole chapter so font setup is paid once
+        self._parser = mathtext.MathTextParser('agg')
+
+    def _cache_path(self, latex: str, mode: str, dpi: int) -> Path:
+        """Path of the cached PNG for this equation, whether or not it exists yet."""
+        key = hashlib.blake2b(f"{_RENDER_VERSION}|{mode}|{dpi}|{latex}".encode(),
+                              digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.png"
+
+    def _from_cache(self, latex: str, filename: str, mode: str, dpi: int = 300) -> Optional[Path]:
+        """Copy a cached render to filename and return its path, or None on a miss."""
+        cached = self._cache_path(latex, mode, dpi)
+        if not cached.exists():
+            return None
+        output_path = self.output_dir / filename
+        shutil.copyfile(cached, output_path)
+        return output_path
 
     def render_equation(self, latex: str, filename: str, mode: str = 'display', dpi: int = 300) -> Path:
-        """Render a single equation to PNG using matplotlib."""
+        """Render a single equation to PNG using matplotlib mathtext."""
+        output_path = self._from_cache(latex, filename, mode, dpi)
+        if output_path:
+            return output_path
+        output_path = self.output_dir / filename
+        cached = self._cache_path(latex, mode, dpi)
+
         try:
-            fig = plt.figure(figsize=(10, 2))
-            fig.patch.set_facecolor('white')
-            fig.patch.set_alpha(0.0)  # Transparent background
+            # mathtext has no line breaks; newlines in the source are just spaces
+            latex = ' '.join(latex.split())
 
-            ax = fig.add_subplot(111)
-            ax.axis('off')
+            # LaTeX is already extracted without delimiters. mathtext has no
+            # $$ display mode, so both modes use $...$ and differ only in size
+            latex_wrapped = f'${latex}$'
+            fontsize = 24 if mode == 'display' else 18
 
-            # LaTeX is already extracted without delimiters, wrap in $ or $$
-            if mode == 'display':
-                latex_wrapped = f'${latex}$'
-                fontsize = 24
-            else:
-                latex_wrapped = f'${latex}$'
-                fontsize = 18
+            # Rasterize straight to an alpha mask (no Figure/Axes, no tight-bbox pass)
+            result = self._parser.parse(latex_wrapped, dpi=dpi,
+                                        prop=FontProperties(size=fontsize))
+            alpha = np.pad(np.asarray(result.image), int(0.1 * dpi))  # 0.1in padding
 
-            ax.text(0.5, 0.5, latex_wrapped,
-                   fontsize=fontsize,
-                   ha='center', va='center',
-                   transform=ax.transAxes)
+            # Black text on a transparent background
+            rgba = np.zeros(alpha.shape + (4,), dtype=np.uint8)
+            rgba[..., 3] = alpha
 
-            output_path = self.output_dir / filename
-            plt.savefig(str(output_path), dpi=dpi, bbox_inches='tight',
-                       pad_inches=0.1, transparent=True)
-            plt.close(fig)
-
-            return output_path
+            mpl_image.imsave(str(output_path), rgba, dpi=dpi)
         except Exception as e:
             # Silently skip equations that can't be rendered
             # print(f"Warning: Failed to render equation: {latex[:50]}...")
-            plt.close('all')  # Clean up
             return None
 
+        # Copy under a per-process name, then rename, so concurrent workers
+        # never see a half-written cache entry. A failed cache write only
+        # costs a re-render next run.
+        tmp = cached.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            shutil.copyfile(output_path, tmp)
+            os.replace(tmp, cached)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+        return output_path
+
     def render_all(self, equations: List[Dict]) -> Dict[int, Path]:
         """Render all equations and return mapping of index to file path."""
         rendered = {}
 
+        # Render each distinct equation once; repeats share the first one's file
+        unique = {}
+        duplicates = {}
+        tasks = []
         for i, eq in enumerate(equations):
+            key = (eq['type'], eq['latex'])
+            if key in unique:
+                duplicates[i] = unique[key]
+                continue
+            unique[key] = i
+
             filename = f"equation_{i:03d}.png"
             mode = 'inline' if eq['type'] == 'inline' else 'display'
 
-            path = self.render_equation(eq['latex'], filename, mode=mode)
+            # Cache hits are just file copies; only misses need rendering
+            path = self._from_cache(eq['latex'], filename, mode)
             if path:
                 rendered[i] = path
+            else:
+                tasks.append((i, eq['latex'], filename, mode))
+
+        if len(tasks) < _MIN_POOL_TASKS:
+            for i, latex, filename, mode in tasks:
+                path = self.render_equation(latex, filename, mode=mode)
+                if path:
+                    rendered[i] = path
+        else:
+            # Equations are independent and CPU-bound, so spread them across cores.
+            # Each worker builds its own renderer, which selects the Agg backend.
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for i, path in executor.map(partial(_render_one, self.output_dir),
+                                            tasks, chunksize=8):
+                    if path:
+                        rendered[i] = path
+
+        for i, first_i in duplicates.items():
+            if first_i in rendered:
+                rendered[i] = rendered[first_i]
 
         return rendered
 
 
+# Per-process renderers, keyed on pid so a forked worker never reuses its parent's
+_worker_renderers = {}
+
+
+def _render_one(output_dir: Path, task: Tuple[int, str, str, str]) -> Tuple[int, Optional[Path]]:
+    """Render one (index, latex, filename, mode) task inside a pool worker."""
+    pid = os.getpid()
+    if pid not in _worker_renderers:
+        _worker_renderers[pid] = EquationRenderer(output_dir)
+    i, latex, filename, mode = task
+    return i, _worker_renderers[pid].render_equation(latex, filename, mode=mode)
+
+
 class SlideBuilder:
     """Build PowerPoint presentation from parsed chapter."""
 
@@ -300,14 +507,20 @@ class SlideBuilder:
         if bullets:
             # Add bullet points
             if len(slide.placeholders) > 1:
-                text_frame = slide.placeholders[1].text_frame
-                text_frame.clear()
+                # Write the <a:p> elements straight into the text body rather
+                # than going through add_paragraph() once per bullet
+                txBody = slide.placeholders[1].text_frame._txBody
+                for p in txBody.findall(qn('a:p')):
+                    txBody.remove(p)
 
+                size = str(Pt(18).centipoints)
                 for bullet in bullets:
-                    p = text_frame.add_paragraph()
-                    p.text = bullet
-                    p.level = 0
-                    p.font.size = Pt(18)
+                    p = etree.SubElement(txBody, qn('a:p'))
+                    pPr = etree.SubElement(p, qn('a:pPr'))
+                    etree.SubElement(pPr, qn('a:defRPr'), sz=size)
+                    r = etree.SubElement(p, qn('a:r'))
+                    etree.SubElement(r, qn('a:t'))
+                    r.text = bullet  # python-pptx's setter escapes control characters
 
         if equation_images:
             # Add equations below bullets
@@ -316,7 +529,7 @@ class SlideBuilder:
             for img_path in equation_images:
                 if img_path and img_path.exists():
                     left = Inches(2)
-                    pic = slide.shapes.add_picture(str(img_path), left, top, height=Inches(1))
+                    self._add_equation_picture(slide, img_path, left, top, Inches(1))
                     top += Inches(1.2)
 
     def add_equation_slide(self, title: str, equation_images: List[Path],
@@ -337,7 +550,7 @@ class SlideBuilder:
         for img_path in equation_images:
             if img_path and img_path.exists():
                 left = Inches(2)
-                pic = slide.shapes.add_picture(str(img_path), left, top, height=Inches(1.2))
+                self._add_equation_picture(slide, img_path, left, top, Inches(1.2))
                 top += Inches(1.5)
 
         # Add description if provided
@@ -347,6 +560,19 @@ class SlideBuilder:
             desc_frame.text = description
             desc_frame.paragraphs[0].font.size = Pt(16)
 
+    def _add_equation_picture(self, slide, img_path: Path, left: int, top: int,
+                              max_height: int):
+        """Add an equation PNG at its native size, shrunk to fit its slot and the slide."""
+        # Equation PNGs are cropped to the formula and carry their DPI, so
+        # python-pptx sizes them to the font size they were rendered at
+        pic = slide.shapes.add_picture(str(img_path), left, top)
+        max_width = self.prs.slide_width - left - Inches(0.5)
+        scale = min(1.0, max_width / pic.width, max_height / pic.height)
+        if scale < 1.0:
+            pic.width = int(pic.width * scale)
+            pic.height = int(pic.height * scale)
+        return pic
+
     def save(self, output_file: Path):
         """Save presentation."""
         self.prs.save(str(output_file))
@@ -395,7 +621,7 @@ def convert_chapter_to_slides(qmd_file: str, output_dir: Optional[str] = None,
     builder.add_title_slide(title)
 
     # Process sections
-    eq_index = 0
+    eq_index = 0  # Equations are in document order, so one pointer serves every section
     for section in sections:
         # Section title slide
         builder.add_section_slide(section['title'])
@@ -406,19 +632,17 @@ def convert_chapter_to_slides(qmd_file: str, output_dir: Optional[str] = None,
 
         # Simple bullet extraction (lines starting with -, *, or numbered)
         for line in section['content'].split('\n'):
-            line = line.strip()
-            if line.startswith(('-', '*', '1.', '2.', '3.', '4.', '5.')):
-                bullets.append(line.lstrip('-*0123456789. '))
+            m = _RE_BULLET.match(line)
+            if m:
+                bullets.append(m.group(1).rstrip())
 
         # Find equations in this section
-        section_start = section['content'][:100]  # Use first 100 chars as marker
-        for i, eq in enumerate(equations):
-            if eq['position'] > parser.content.find(section_start):
-                if eq_index < len(equation_images):
-                    section_equations.append(equation_images[eq_index])
-                    eq_index += 1
-                if len(section_equations) >= 3:  # Limit equations per section
-                    break
+        while eq_index < len(equations) and equations[eq_index]['position'] < section['start_offset']:
+            eq_index += 1
+        while eq_index < len(equations) and equations[eq_index]['position'] < section['end_offset']:
+            if eq_index in equation_images and len(section_equations) < 3:  # Limit equations per section
+                section_equations.append(equation_images[eq_index])
+            eq_index += 1
 
         # Add content slide
         if bullets or section_equations:
@@ -1,7 +1,12 @@
 import os
 import json
 import subprocess
-import re
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # Optional; faster than json for reading large notebooks
+except ImportError:
+    orjson = None
 
 # subprocess.run("rm ../book-published-code/*.ipynb")
 
@@ -18,41 +23,44 @@ def has_python_chunks(qmd_file):
     """Check if a .qmd file contains any Python code chunks."""
     try:
         with open(qmd_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        # Look for ```{python} blocks
-        return bool(re.search(r'```\{python\}', content))
+            # Look for ```{python} blocks, stopping at the first one
+            for line in f:
+                if '```{python}' in line:
+                    return True
+        return False
     except FileNotFoundError:
         return False
 
-# Read chapters from _quarto.yml
-with open("_quarto.yml", "r") as f:
-    lines = [
-        line for line in f.readlines()
-        if line.strip().startswith("- Chapter")
-    ]
-chapters = [line.strip()[2:] for line in lines]
-
-# Filter chapters to only those with Python code
-print(f"Found {len(chapters)} chapters in _quarto.yml")
-chapters = [c for c in chapters if has_python_chunks(c)]
-print(f"Processing {len(chapters)} chapters with Python code")
-
-numbers = [f"0{n}" for n in range(1, 10)] + [str(n) for n in range(10, len(chapters) + 1)]
-names = [c.split("_")[1].replace("qmd", "ipynb") for c in chapters]
-notebooks_out = [number + "_" + name for number, name in zip(numbers, names)]
+def read_notebook(path):
+    """Load notebook JSON, using orjson if available."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-notebooks_in = [c.replace("qmd", "ipynb") for c in chapters]
+def write_notebook(path, js):
+    """Write notebook JSON with 2-space indentation."""
+    # Always stdlib json: orjson writes non-ASCII raw where json escapes it,
+    # so published notebooks would change with whatever happens to be installed
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(js, f, indent=2)
 
-for chapter, notebook_in, notebook_out in zip(chapters, notebooks_in, notebooks_out):
+def convert_chapter(chapter):
+    """Run quarto convert on one chapter, producing its .ipynb alongside it."""
     print(f"Converting {chapter}...")
-    subprocess.run("quarto convert " + chapter, shell=True, check=True)
-    with open(notebook_in, 'r') as f:
-        js = json.load(f)
+    subprocess.run(["quarto", "convert", chapter], check=True)
+
+def publish_notebook(notebook_in, notebook_out):
+    """Strip a converted notebook to its code, add the header cell and write it out."""
+    js = read_notebook(notebook_in)
 
     js['cells'] = [cell for cell in js['cells'] if cell['cell_type'] != 'markdown']
 
     for cell in js['cells']:
-        cell['source'] = [line for line in cell['source'] if not line.strip().startswith('#|')]
+        # Only rebuild the source list when there are chunk options to strip
+        if any(line.lstrip().startswith('#|') for line in cell['source']):
+            cell['source'] = [line for line in cell['source'] if not line.lstrip().startswith('#|')]
 
     new_cell = {
     "cell_type": "markdown",
@@ -75,18 +83,47 @@ for chapter, notebook_in, notebook_out in zip(chapters, notebooks_in, notebooks_
     ]
     }
     js['cells'].insert(0, new_cell)
-    with open("../book-published-code/" + notebook_out, 'w') as f:
-        json.dump(js, f, indent=2)
+    write_notebook("../book-published-code/" + notebook_out, js)
     os.remove(notebook_in)
 
+def process_chapter(chapter, notebook_in, notebook_out):
+    """Convert one chapter and publish its notebook."""
+    convert_chapter(chapter)
+    publish_notebook(notebook_in, notebook_out)
+
+# Read chapters from _quarto.yml
+with open("_quarto.yml", "r") as f:
+    lines = [
+        line for line in f.readlines()
+        if line.strip().startswith("- Chapter")
+    ]
+chapters = [line.strip()[2:] for line in lines]
+
+# Filter chapters to only those with Python code
+print(f"Found {len(chapters)} chapters in _quarto.yml")
+chapters = [c for c in chapters if has_python_chunks(c)]
+print(f"Processing {len(chapters)} chapters with Python code")
+
+numbers = [f"0{n}" for n in range(1, 10)] + [str(n) for n in range(10, len(chapters) + 1)]
+names = [c.split("_")[1].replace("qmd", "ipynb") for c in chapters]
+notebooks_out = [number + "_" + name for number, name in zip(numbers, names)]
+
+notebooks_in = [c.replace("qmd", "ipynb") for c in chapters]
+
+# Each chapter is independent, so convert and publish them side by side;
+# one chapter's JSON rewrite overlaps with the next chapter's quarto run
+workers = max(1, min(len(chapters), (os.cpu_count() or 1) * 2))  # cpu_count() may be None
+with ThreadPoolExecutor(max_workers=workers) as executor:
+    list(executor.map(process_chapter, chapters, notebooks_in, notebooks_out))
+
 # Add and commit new notebooks
 print("\nCommitting notebooks...")
-subprocess.run("git -C ../book-published-code add .", shell=True, check=True)
-result = subprocess.run('git -C ../book-published-code commit -m "update notebooks"', shell=True)
+subprocess.run(["git", "-C", "../book-published-code", "add", "."], check=True)
+result = subprocess.run(["git", "-C", "../book-published-code", "commit", "-m", "update notebooks"])
 
 if result.returncode == 0:
     print("Pushing to remote...")
-    subprocess.run("git -C ../book-published-code push origin main", shell=True, check=True)
+    subprocess.run(["git", "-C", "../book-published-code", "push", "origin", "main"], check=True)
     print("Done!")
 else:
     print("No changes to commit.")
\ No newline at end of file